@@ -90,9 +90,7 @@ class TransactionClassifier:
         Returns:
             ClassificationResult with type, nature, and confidence.
         """
-        desc_upper = (description or "").upper()
-
-        # 1. Try pattern-based classification
+        # 1. Try pattern-based classification (patterns are (?i), so no case folding)
         for pattern, txn_type, txn_nature, confidence in self._NATURE_PATTERNS:
             if re.search(pattern, description):
                 return ClassificationResult(
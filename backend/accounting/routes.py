@@ -98,8 +98,8 @@ def create_accounting_transaction(
 
     # Validate
     txn_input = TransactionInput(
-        transaction_type=TransactionType(payload.transaction_type.value),
-        transaction_nature=TransactionNature(payload.transaction_nature.value),
+        transaction_type=TransactionType(payload.transaction_type),
+        transaction_nature=TransactionNature(payload.transaction_nature),
         amount=payload.amount,
         currency=payload.currency,
         from_account_id=payload.from_account_id,
@@ -124,8 +124,8 @@ def create_accounting_transaction(
         description=payload.description,
         amount=payload.amount,
         currency=payload.currency,
-        transaction_type=payload.transaction_type.value,
-        transaction_nature=payload.transaction_nature.value,
+        transaction_type=payload.transaction_type,
+        transaction_nature=payload.transaction_nature,
         date=payload.date,
         from_account_id=payload.from_account_id,
         to_account_id=payload.to_account_id,
@@ -144,8 +144,8 @@ def create_accounting_transaction(
     # Generate ledger entries
     entries = _ledger.create_entries(
         transaction_id=txn.id,
-        txn_type=TransactionType(payload.transaction_type.value),
-        txn_nature=TransactionNature(payload.transaction_nature.value),
+        txn_type=TransactionType(payload.transaction_type),
+        txn_nature=TransactionNature(payload.transaction_nature),
         amount=payload.amount,
         date=payload.date,
         description=payload.description,
@@ -174,8 +174,8 @@ def create_accounting_transaction(
 
     logger.info(
         "Created accounting txn #%s: %s %s (%s/%s)",
-        txn.id, payload.transaction_type.value,
-        payload.transaction_nature.value, payload.amount, payload.currency,
+        txn.id, payload.transaction_type,
+        payload.transaction_nature, payload.amount, payload.currency,
     )
 
     return {
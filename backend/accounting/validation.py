@@ -35,7 +35,7 @@ class ValidationError(Exception):
         super().__init__("; ".join(errors))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransactionInput:
     """Lightweight DTO for pre-validation (not a DB model)."""
 
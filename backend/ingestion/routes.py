@@ -1,9 +1,9 @@
-from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, Response
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 import logging
 from ..models import get_session, User, Transaction, TransactionAudit, Account
-from ..schemas import TransactionCreate, TransactionOut
+from ..schemas import TransactionCreate, TransactionOut, TransactionListAdapter
 from .processor import processor
 from ..config import settings
 
@@ -172,4 +172,10 @@ async def confirm_import(
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
-    return saved_txns
+    # Validate + serialize the whole batch in one pydantic-core call; returning
+    # a Response skips FastAPI's per-item re-validation of response_model.
+    validated = TransactionListAdapter.validate_python(saved_txns, from_attributes=True)
+    return Response(
+        content=TransactionListAdapter.dump_json(validated),
+        media_type="application/json",
+    )
@@ -3,6 +3,7 @@
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi import Body
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import httpx
 import json
@@ -84,7 +85,9 @@ app = FastAPI(
     description="AI-driven Personal Finance Manager running locally",
     lifespan=lifespan,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson encodes response bodies in C, much faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -1,8 +1,16 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
-from typing import Optional, List
+from typing import Literal, Optional, List
 from enum import Enum
 
+# Shared optional aliases — reusing one annotation object per type lets
+# pydantic (>=2.11) reuse the cached core schema across all models.
+OptStr = Optional[str]
+OptInt = Optional[int]
+OptFloat = Optional[float]
+OptBool = Optional[bool]
+OptDT = Optional[datetime]
+
 
 # ─── Accounting Enums (for schema validation) ─────────────────────────────
 
@@ -38,55 +46,68 @@ class AccountingTypeEnum(str, Enum):
     RECEIVABLE = "receivable"
     PAYABLE = "payable"
 
+
+# Literal twins of the enums above for request fields: pydantic-core checks a
+# Literal with a set lookup instead of coercing into an Enum member.
+# Keep in sync with the enums (enforced by test_schema_literals_match_enums).
+TransactionTypeLiteral = Literal["income", "expense", "transfer"]
+TransactionNatureLiteral = Literal[
+    "salary", "business_income", "investment_income", "gift_received",
+    "refund", "other_income", "purchase", "subscription", "bill_payment",
+    "reimbursement_paid", "gift_given", "other_expense", "internal_transfer",
+    "cc_bill_payment", "reimbursement_received", "loan_given", "loan_received",
+    "loan_repaid", "adjustment",
+]
+
 class TransactionBase(BaseModel):
     description: str
     amount: float
     currency: str = "INR"
     transaction_type: str
-    transaction_nature: Optional[str] = None
+    transaction_nature: OptStr = None
     date: datetime
-    account: Optional[str] = None
-    reference: Optional[str] = None
+    account: OptStr = None
+    reference: OptStr = None
 
     # Double-entry accounting
-    from_account_id: Optional[int] = None
-    to_account_id: Optional[int] = None
-    counterparty: Optional[str] = None
+    from_account_id: OptInt = None
+    to_account_id: OptInt = None
+    counterparty: OptStr = None
     
     # Ingestion Metadata
-    amount_original: Optional[float] = None
-    currency_original: Optional[str] = None
-    exchange_rate: Optional[float] = None
-    source: Optional[str] = "manual"
-    source_file: Optional[str] = None
-    raw_data: Optional[str] = None
+    amount_original: OptFloat = None
+    currency_original: OptStr = None
+    exchange_rate: OptFloat = None
+    source: OptStr = "manual"
+    source_file: OptStr = None
+    raw_data: OptStr = None
 
     # Enriched metadata for ML / auto-categorization
-    merchant_name: Optional[str] = None
-    merchant_category: Optional[str] = None
-    transaction_method: Optional[str] = None
-    location: Optional[str] = None
-    card_last_four: Optional[str] = None
-    metadata_json: Optional[str] = None
-
-    tags: Optional[str] = None
-    notes: Optional[str] = None
+    merchant_name: OptStr = None
+    merchant_category: OptStr = None
+    transaction_method: OptStr = None
+    location: OptStr = None
+    card_last_four: OptStr = None
+    metadata_json: OptStr = None
+
+    tags: OptStr = None
+    notes: OptStr = None
     is_recurring: bool = False
     is_duplicate: bool = False
-    confidence_score: Optional[float] = None
+    confidence_score: OptFloat = None
 
 class TransactionCreate(TransactionBase):
     user_id: int
-    category_id: Optional[int] = None
-    account_id: Optional[int] = None
+    category_id: OptInt = None
+    account_id: OptInt = None
 
 class TransactionOut(TransactionBase):
     id: int
     user_id: int
-    category_id: Optional[int] = None
-    account_id: Optional[int] = None
+    category_id: OptInt = None
+    account_id: OptInt = None
     is_deleted: bool = False
-    deleted_at: Optional[datetime] = None
+    deleted_at: OptDT = None
     created_at: datetime
     updated_at: datetime
 
@@ -96,25 +117,25 @@ class TransactionOut(TransactionBase):
 
 class TransactionUpdate(BaseModel):
     """Schema for editing a transaction. All fields optional."""
-    description: Optional[str] = None
-    amount: Optional[float] = None
-    currency: Optional[str] = None
-    transaction_type: Optional[str] = None
-    transaction_nature: Optional[str] = None
-    date: Optional[datetime] = None
-    category_id: Optional[int] = None
-    account_id: Optional[int] = None
-    account: Optional[str] = None
-    from_account_id: Optional[int] = None
-    to_account_id: Optional[int] = None
-    counterparty: Optional[str] = None
-    merchant_name: Optional[str] = None
-    merchant_category: Optional[str] = None
-    transaction_method: Optional[str] = None
-    location: Optional[str] = None
-    tags: Optional[str] = None
-    notes: Optional[str] = None
-    is_recurring: Optional[bool] = None
+    description: OptStr = None
+    amount: OptFloat = None
+    currency: OptStr = None
+    transaction_type: OptStr = None
+    transaction_nature: OptStr = None
+    date: OptDT = None
+    category_id: OptInt = None
+    account_id: OptInt = None
+    account: OptStr = None
+    from_account_id: OptInt = None
+    to_account_id: OptInt = None
+    counterparty: OptStr = None
+    merchant_name: OptStr = None
+    merchant_category: OptStr = None
+    transaction_method: OptStr = None
+    location: OptStr = None
+    tags: OptStr = None
+    notes: OptStr = None
+    is_recurring: OptBool = None
 
 
 class TransactionAuditOut(BaseModel):
@@ -122,11 +143,11 @@ class TransactionAuditOut(BaseModel):
     transaction_id: int
     user_id: int
     action: str
-    field_changed: Optional[str] = None
-    old_value: Optional[str] = None
-    new_value: Optional[str] = None
+    field_changed: OptStr = None
+    old_value: OptStr = None
+    new_value: OptStr = None
     timestamp: datetime
-    notes: Optional[str] = None
+    notes: OptStr = None
 
     class Config:
         from_attributes = True
@@ -134,8 +155,8 @@ class TransactionAuditOut(BaseModel):
 class CategoryBase(BaseModel):
     name: str
     type: str
-    icon: Optional[str] = None
-    color: Optional[str] = None
+    icon: OptStr = None
+    color: OptStr = None
     is_custom: bool = False
     confidence_threshold: float = 0.7
 
@@ -159,23 +180,23 @@ class BudgetBase(BaseModel):
 
 class BudgetCreate(BudgetBase):
     user_id: int
-    category_id: Optional[int] = None
+    category_id: OptInt = None
 
 class BudgetOut(BudgetBase):
     id: int
     user_id: int
-    category_id: Optional[int] = None
+    category_id: OptInt = None
 
     class Config:
         from_attributes = True
 
 class GoalBase(BaseModel):
     name: str
-    description: Optional[str] = None
+    description: OptStr = None
     target_amount: float
     current_amount: float = 0.0
     target_date: datetime
-    category: Optional[str] = None
+    category: OptStr = None
     is_active: bool = True
 
 class GoalCreate(GoalBase):
@@ -192,12 +213,12 @@ class AssetBase(BaseModel):
     name: str
     type: str
     quantity: float
-    unit: Optional[str] = None
+    unit: OptStr = None
     purchase_price: float
     current_value: float
     currency: str = "INR"
     purchase_date: datetime
-    notes: Optional[str] = None
+    notes: OptStr = None
 
 class AssetCreate(AssetBase):
     user_id: int
@@ -232,33 +253,33 @@ class ChatResponse(BaseModel):
 class AccountBase(BaseModel):
     name: str
     account_type: str  # savings, current, NRO, NRE, FD, PPF, stocks, receivable, payable, etc.
-    institution: Optional[str] = None
-    account_number_masked: Optional[str] = None
+    institution: OptStr = None
+    account_number_masked: OptStr = None
     currency: str = "INR"
     balance: float = 0.0
     is_active: bool = True
-    icon: Optional[str] = None
-    color: Optional[str] = None
-    notes: Optional[str] = None
-    accounting_type: Optional[str] = None  # asset, liability, receivable, payable
-    counterparty: Optional[str] = None  # For receivable/payable accounts
+    icon: OptStr = None
+    color: OptStr = None
+    notes: OptStr = None
+    accounting_type: OptStr = None  # asset, liability, receivable, payable
+    counterparty: OptStr = None  # For receivable/payable accounts
 
 class AccountCreate(AccountBase):
     user_id: int
 
 class AccountUpdate(BaseModel):
-    name: Optional[str] = None
-    account_type: Optional[str] = None
-    institution: Optional[str] = None
-    account_number_masked: Optional[str] = None
-    currency: Optional[str] = None
-    balance: Optional[float] = None
-    is_active: Optional[bool] = None
-    icon: Optional[str] = None
-    color: Optional[str] = None
-    notes: Optional[str] = None
-    accounting_type: Optional[str] = None
-    counterparty: Optional[str] = None
+    name: OptStr = None
+    account_type: OptStr = None
+    institution: OptStr = None
+    account_number_masked: OptStr = None
+    currency: OptStr = None
+    balance: OptFloat = None
+    is_active: OptBool = None
+    icon: OptStr = None
+    color: OptStr = None
+    notes: OptStr = None
+    accounting_type: OptStr = None
+    counterparty: OptStr = None
 
 class AccountOut(AccountBase):
     id: int
@@ -275,11 +296,11 @@ class AccountOut(AccountBase):
 class LedgerEntryOut(BaseModel):
     id: int
     transaction_id: int
-    account_id: Optional[int] = None
+    account_id: OptInt = None
     debit: float
     credit: float
     entry_date: datetime
-    description: Optional[str] = None
+    description: OptStr = None
 
     class Config:
         from_attributes = True
@@ -292,16 +313,16 @@ class AccountingTransactionCreate(BaseModel):
     amount: float
     currency: str = "INR"
     date: datetime
-    transaction_type: TransactionTypeEnum
-    transaction_nature: TransactionNatureEnum
-    from_account_id: Optional[int] = None
-    to_account_id: Optional[int] = None
-    category: Optional[str] = None
-    category_id: Optional[int] = None
-    counterparty: Optional[str] = None
-    notes: Optional[str] = None
-    tags: Optional[str] = None
-    reference: Optional[str] = None
+    transaction_type: TransactionTypeLiteral
+    transaction_nature: TransactionNatureLiteral
+    from_account_id: OptInt = None
+    to_account_id: OptInt = None
+    category: OptStr = None
+    category_id: OptInt = None
+    counterparty: OptStr = None
+    notes: OptStr = None
+    tags: OptStr = None
+    reference: OptStr = None
 
 
 class ValidationRequest(BaseModel):
@@ -310,12 +331,12 @@ class ValidationRequest(BaseModel):
     transaction_nature: str
     amount: float
     currency: str = "INR"
-    from_account_id: Optional[int] = None
-    to_account_id: Optional[int] = None
-    from_account_type: Optional[str] = None
-    to_account_type: Optional[str] = None
-    category: Optional[str] = None
-    counterparty: Optional[str] = None
+    from_account_id: OptInt = None
+    to_account_id: OptInt = None
+    from_account_type: OptStr = None
+    to_account_type: OptStr = None
+    category: OptStr = None
+    counterparty: OptStr = None
 
 
 class ValidationResponse(BaseModel):
@@ -326,8 +347,8 @@ class ValidationResponse(BaseModel):
 class ClassificationRequest(BaseModel):
     description: str
     amount: float = 0.0
-    from_account_type: Optional[str] = None
-    to_account_type: Optional[str] = None
+    from_account_type: OptStr = None
+    to_account_type: OptStr = None
 
 
 class ClassificationResponse(BaseModel):
@@ -361,3 +382,9 @@ class OutstandingLoansResponse(BaseModel):
     total_receivable: float
     total_payable: float
     net_loan_position: float
+
+
+# ─── Bulk adapters ───
+# Validate / serialize whole lists inside pydantic-core instead of per row.
+
+TransactionListAdapter = TypeAdapter(List[TransactionOut])
@@ -4,18 +4,26 @@ CurrencyService — Multi-currency conversion, formatting, and metadata.
 Supports 50+ international currencies with:
 - Real-time conversion via CurrencyConverter (ECB rates)
 - Fallback static rates for currencies not in ECB (QAR, AED, SAR, etc.)
+- Vectorised batch conversion over NumPy arrays
 - Symbol/locale formatting
 - Thread-safe caching
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from datetime import datetime
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Mapping, Optional, Tuple
 from currency_converter import CurrencyConverter
+import sys
 import threading
+import time
+
+if TYPE_CHECKING:
+    import numpy as np  # imported lazily by the batch helpers
 
 # ---------- Currency metadata ----------
 
-CURRENCY_INFO: Dict[str, Dict] = {
+_CURRENCY_INFO_RAW: Dict[str, Dict] = {
     "INR": {"symbol": "₹", "name": "Indian Rupee", "locale": "en-IN"},
     "USD": {"symbol": "$", "name": "US Dollar", "locale": "en-US"},
     "EUR": {"symbol": "€", "name": "Euro", "locale": "de-DE"},
@@ -67,6 +75,50 @@ CURRENCY_INFO: Dict[str, Dict] = {
     "JOD": {"symbol": "JD", "name": "Jordanian Dinar", "locale": "ar-JO"},
 }
 
+# Read-only view with interned codes, so lookups of interned keys
+# short-circuit on identity.
+CURRENCY_INFO: Mapping[str, Dict] = MappingProxyType(
+    {sys.intern(code): info for code, info in _CURRENCY_INFO_RAW.items()}
+)
+
+# Currencies with no decimal (JPY, KRW, VND, etc.)
+_NO_DECIMAL = frozenset({"JPY", "KRW", "VND", "CLP", "IDR", "HUF"})
+
+# Format spec per known currency code; unknown codes use two decimals
+_FORMAT_SPEC: Dict[str, str] = {
+    code: ",.0f" if code in _NO_DECIMAL else ",.2f" for code in CURRENCY_INFO
+}
+
+
+@lru_cache(maxsize=256)
+def _get_formatter(code: str) -> Callable[[float], str]:
+    """Amount formatter specialised for one upper-cased currency code."""
+    info = CURRENCY_INFO.get(code)
+    symbol = info["symbol"] if info else code
+    spec = _FORMAT_SPEC.get(code, ",.2f")
+
+    def fmt(amount: float) -> str:
+        sign = "-" if amount < 0 else ""
+        return f"{sign}{symbol}{format(abs(amount), spec)}"
+
+    return fmt
+
+
+# Stable currency → position mapping for the vectorised batch conversion
+CURRENCY_INDEX: Mapping[str, int] = MappingProxyType(
+    {code: i for i, code in enumerate(sorted(CURRENCY_INFO))}
+)
+
+
+@cache
+def _supported_currencies() -> Tuple[Mapping[str, str], ...]:
+    # Shared by every caller, so neither the sequence nor the entries are mutable
+    return tuple(
+        MappingProxyType({"code": code, **info})
+        for code, info in sorted(CURRENCY_INFO.items(), key=lambda x: x[0])
+    )
+
+
 # Static USD-based fallback rates for currencies not covered by ECB
 # (Gulf currencies are USD-pegged, so these are stable)
 _STATIC_USD_RATES: Dict[str, float] = {
@@ -87,64 +139,69 @@ _STATIC_USD_RATES: Dict[str, float] = {
     "ARS": 1050.0,
 }
 
+# Every pair of static currencies (plus USD), precomputed via the USD pivot.
+# None of these are published by the ECB, so they never need the converter.
+_STATIC_PAIR_RATES: Dict[Tuple[str, str], float] = {
+    (a, b): rb / ra
+    for a, ra in {**_STATIC_USD_RATES, "USD": 1.0}.items()
+    for b, rb in {**_STATIC_USD_RATES, "USD": 1.0}.items()
+}
+
+# Marks a CurrencyConverter init that already failed, so it is not retried
+_CONVERTER_FAILED = object()
+
+
+class _RateUnavailable(LookupError):
+    """No source has a rate; raised so the LRU never caches the miss."""
+
 
 class CurrencyService:
     """Thread-safe currency conversion with caching."""
 
     def __init__(self):
+        # The ECB CSV is parsed on first use rather than at import time
         self._lock = threading.Lock()
-        self._converter: Optional[CurrencyConverter] = None
-        self._cache: Dict[str, Tuple[float, datetime]] = {}
-        self._cache_ttl = timedelta(hours=6)
-        self._init_converter()
-
-    def _init_converter(self):
-        try:
-            self._converter = CurrencyConverter()
-        except Exception:
-            self._converter = None
-            print("[CurrencyService] WARNING: CurrencyConverter init failed, using static rates only")
+        self._converter = None
+        self._cache_ttl = 6 * 60 * 60  # seconds
+        # Cache entries are keyed by epoch; bumping it every TTL period
+        # makes older entries unreachable so they age out of the LRU.
+        self._epoch = 0
+        self._epoch_started = time.monotonic()
+        self._get_rate_cached = lru_cache(maxsize=4096)(self._get_rate_uncached)
+
+    def _get_converter(self) -> Optional[CurrencyConverter]:
+        if self._converter is None:
+            with self._lock:
+                if self._converter is None:
+                    try:
+                        self._converter = CurrencyConverter()
+                    except Exception:
+                        self._converter = _CONVERTER_FAILED
+                        print("[CurrencyService] WARNING: CurrencyConverter init failed, using static rates only")
+        if self._converter is _CONVERTER_FAILED:
+            return None
+        return self._converter
 
     # --------------------------------------------------
     # Public API
     # --------------------------------------------------
 
     def get_supported_currencies(self):
-        """Return list of supported currencies with metadata."""
-        return [
-            {"code": code, **info}
-            for code, info in sorted(CURRENCY_INFO.items(), key=lambda x: x[0])
-        ]
+        """Return supported currencies with metadata (built once, read-only)."""
+        return _supported_currencies()
 
     def get_symbol(self, currency_code: str) -> str:
-        info = CURRENCY_INFO.get(currency_code.upper())
-        return info["symbol"] if info else currency_code.upper()
+        code = sys.intern(currency_code.upper())
+        info = CURRENCY_INFO.get(code)
+        return info["symbol"] if info else code
 
     def get_rate(self, from_currency: str, to_currency: str, date: Optional[datetime] = None) -> float:
         """Get exchange rate from_currency → to_currency."""
         frm = from_currency.upper()
         to = to_currency.upper()
 
-        if frm == to:
-            return 1.0
-
-        cache_key = f"{frm}_{to}_{(date or datetime.utcnow()).strftime('%Y-%m-%d')}"
-        with self._lock:
-            if cache_key in self._cache:
-                rate, cached_at = self._cache[cache_key]
-                if datetime.utcnow() - cached_at < self._cache_ttl:
-                    return rate
-
-        # Strategy 1: CurrencyConverter (ECB data)
-        rate = self._try_ecb(frm, to, date)
+        rate = self._lookup_rate(frm, to, date)
         if rate is not None:
-            self._set_cache(cache_key, rate)
-            return rate
-
-        # Strategy 2: Static USD pivot
-        rate = self._try_static_pivot(frm, to)
-        if rate is not None:
-            self._set_cache(cache_key, rate)
             return rate
 
         # Fallback: return 1.0 and log warning
@@ -157,34 +214,64 @@ class CurrencyService:
         rate = self.get_rate(from_currency, to_currency, date)
         return round(amount * rate, 2)
 
-    def format_amount(self, amount: float, currency_code: str) -> str:
-        """Format an amount with the correct symbol."""
-        symbol = self.get_symbol(currency_code)
-        abs_amount = abs(amount)
-        sign = "-" if amount < 0 else ""
+    def build_rate_vector(self, to_currency: str,
+                          date: Optional[datetime] = None) -> "np.ndarray":
+        """
+        Rates from every supported currency into ``to_currency``, indexed
+        by ``CURRENCY_INDEX``.  Currencies without a rate map to 1.0, the
+        same fallback ``get_rate`` uses.
+        """
+        import numpy as np  # only batch callers pay numpy's import cost
 
-        # Currencies with no decimal (JPY, KRW, VND, etc.)
-        no_decimal = {"JPY", "KRW", "VND", "CLP", "IDR", "HUF"}
-        if currency_code.upper() in no_decimal:
-            formatted = f"{abs_amount:,.0f}"
-        else:
-            formatted = f"{abs_amount:,.2f}"
+        to = to_currency.upper()
+        return np.fromiter(
+            (self._lookup_rate(code, to, date) or 1.0 for code in CURRENCY_INDEX),
+            dtype=np.float64,
+            count=len(CURRENCY_INDEX),
+        )
+
+    def convert_batch(self, amounts: "np.ndarray", from_codes: "np.ndarray",
+                      to_currency: str, date: Optional[datetime] = None) -> "np.ndarray":
+        """
+        Vectorised ``convert``: ``from_codes`` holds ``CURRENCY_INDEX``
+        positions, one per amount.
+        """
+        import numpy as np
+
+        rate_vec = self.build_rate_vector(to_currency, date)
+        return np.round(np.asarray(amounts, dtype=np.float64) * rate_vec[from_codes], 2)
 
-        return f"{sign}{symbol}{formatted}"
+    def format_amount(self, amount: float, currency_code: str) -> str:
+        """Format an amount with the correct symbol."""
+        return _get_formatter(currency_code.upper())(amount)
 
     # --------------------------------------------------
     # Private helpers
     # --------------------------------------------------
 
+    def _lookup_rate(self, frm: str, to: str, date: Optional[datetime]) -> Optional[float]:
+        """Rate for already upper-cased codes, or None if no source has one."""
+        if frm == to:
+            return 1.0
+
+        rate = _STATIC_PAIR_RATES.get((frm, to))
+        if rate is not None:
+            return rate
+
+        try:
+            return self._get_rate_cached(
+                frm, to, date.toordinal() if date else None, self._current_epoch()
+            )
+        except _RateUnavailable:
+            return None
+
     def _try_ecb(self, frm: str, to: str, date: Optional[datetime]) -> Optional[float]:
-        if not self._converter:
+        converter = self._get_converter()
+        if not converter:
             return None
         try:
-            if date:
-                rate = self._converter.convert(1.0, frm, to, date=date)
-            else:
-                rate = self._converter.convert(1.0, frm, to)
-            return float(rate)
+            # date=None makes CurrencyConverter use its latest rate
+            return float(converter.convert(1.0, frm, to, date=date))
         except Exception:
             return None
 
@@ -211,17 +298,38 @@ class CurrencyService:
             return _STATIC_USD_RATES[currency]
 
         # Try ECB: 1 USD → ? currency
-        if self._converter:
+        converter = self._get_converter()
+        if converter:
             try:
-                return float(self._converter.convert(1.0, "USD", currency))
+                return float(converter.convert(1.0, "USD", currency))
             except Exception:
                 pass
 
         return None
 
-    def _set_cache(self, key: str, rate: float):
-        with self._lock:
-            self._cache[key] = (rate, datetime.utcnow())
+    def _current_epoch(self) -> int:
+        now = time.monotonic()
+        if now - self._epoch_started >= self._cache_ttl:
+            self._epoch_started = now
+            self._epoch += 1
+        return self._epoch
+
+    def _get_rate_uncached(
+        self, frm: str, to: str, date_ordinal: Optional[int], epoch: int
+    ) -> float:
+        """Resolve a rate without caching; ``epoch`` only partitions the LRU."""
+        date = datetime.fromordinal(date_ordinal) if date_ordinal is not None else None
+
+        # Strategy 1: CurrencyConverter (ECB data)
+        rate = self._try_ecb(frm, to, date)
+        if rate is not None:
+            return rate
+
+        # Strategy 2: Static USD pivot
+        rate = self._try_static_pivot(frm, to)
+        if rate is None:
+            raise _RateUnavailable(f"{frm} → {to}")
+        return rate
 
 
 # Module-level singleton
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import sqlite3
+from pathlib import Path
 
 from config import settings
 
 
 def main() -> None:
-    conn = sqlite3.connect(settings.DATABASE_PATH)
+    db_uri = f"{Path(settings.DATABASE_PATH).resolve().as_uri()}?cache=shared"
+    conn = sqlite3.connect(db_uri, uri=True)
     try:
+        # Serve the COUNT(*) scans from a memory map instead of per-page reads.
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
         tables = [
             r[0]
             for r in conn.execute(
@@ -15,8 +20,13 @@ def main() -> None:
             ).fetchall()
         ]
         print("tables:", tables)
-        for table in tables:
-            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        if not tables:
+            return
+        # One round-trip for every table's row count.
+        sql = " UNION ALL ".join(
+            f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables
+        )
+        for table, count in conn.execute(sql).fetchall():
             print(f"{table}: {count}")
     finally:
         conn.close()
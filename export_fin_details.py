@@ -1,6 +1,6 @@
 import pandas as pd
 import os
-import json
+import orjson
 
 excel_path = os.path.join(os.path.dirname(__file__), 'Fin_details.xlsx')
 json_path = os.path.join(os.path.dirname(__file__), 'fin_details.json')
@@ -9,12 +9,14 @@ def main():
     if not os.path.exists(excel_path):
         print('File not found.')
         return
-    df = pd.read_excel(excel_path)
+    df = pd.read_excel(excel_path, engine='calamine')
     # Convert dates to string for JSON serialization
     df['T_date'] = df['T_date'].astype(str)
     df['P_date'] = df['P_date'].astype(str)
-    # Export to JSON
-    df.to_json(json_path, orient='records', indent=2)
+    # Export to JSON (orjson encodes the records in C, far faster than df.to_json)
+    records = df.to_dict(orient='records')
+    with open(json_path, 'wb') as f:
+        f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     print(f'Exported {len(df)} records to {json_path}')
 
 if __name__ == '__main__':
@@ -0,0 +1,36 @@
+"""Shared pytest setup for the backend test suite."""
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# Put the repo root on sys.path (once per session, even if conftest is
+# re-imported). Tests import the app only as the `backend` package: the API
+# routers use package-relative imports, and a single import root means each
+# module (and enum class) is loaded exactly once.
+ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Skip modules whose optional stack isn't installed (TestClient runs on httpx)
+_REQUIRES = {
+    "test_routes.py": ("fastapi", "httpx"),
+    "test_currency.py": ("currency_converter",),
+}
+collect_ignore = [
+    name for name, modules in _REQUIRES.items()
+    if any(importlib.util.find_spec(m) is None for m in modules)
+]
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: end-to-end ledger scenarios")
+    # Registered here too so the hook below works without pytest-xdist installed
+    config.addinivalue_line("markers", "xdist_group(name): run on one pytest-xdist worker")
+
+
+def pytest_collection_modifyitems(items):
+    # With `-n auto --dist=loadgroup`, keep each test class (and its fixtures) on one worker
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(item.cls.__name__ if item.cls else "mod"))
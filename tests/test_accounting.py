@@ -8,16 +8,18 @@ Tests cover:
   4. Enum consistency
 
 Run:  python -m pytest tests/test_accounting.py -v
+  or: python -m tests.test_accounting   (from the repo root)
 """
-import sys
-import os
+import functools
+from collections import Counter
+import numpy as np
 import pytest
 from datetime import datetime
+from operator import attrgetter
+from typing import get_args
 
-# Add backend to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
-
-from accounting.enums import (
+# The repo root is put on sys.path by tests/conftest.py
+from backend.accounting.enums import (
     AccountingType,
     TransactionNature,
     TransactionType,
@@ -25,15 +27,66 @@ from accounting.enums import (
     is_valid_nature_for_type,
     VALID_NATURE_FOR_TYPE,
 )
-from accounting.validation import (
+from backend.accounting.validation import (
     TransactionInput,
     ValidationError,
     validate_transaction,
     validate_transaction_soft,
     get_ux_hints,
 )
-from accounting.ledger import LedgerEngine
-from accounting.classifier import TransactionClassifier
+from backend.accounting.ledger import LedgerEngine
+from backend.accounting.classifier import TransactionClassifier
+
+# Stateless engine and a single timestamp shared by every test
+_ENGINE = LedgerEngine()
+_NOW = datetime.utcnow()
+_DEBIT = attrgetter("debit")
+_CREDIT = attrgetter("credit")
+
+
+@functools.lru_cache(maxsize=None)
+def _txn(key):
+    return TransactionInput(**dict(key))
+
+
+def txn(**kw):
+    """Memoized TransactionInput: identical kwargs share one (frozen) instance."""
+    return _txn(tuple(sorted(kw.items())))
+
+
+def _has(errors, needle):
+    """True if any error message contains needle (case-insensitive)."""
+    return needle in "\n".join(errors).lower()
+
+
+def _income(tid, amount, to_id, to_type):
+    """create_entries() for a SALARY income into one account, dated _NOW."""
+    return _ENGINE.create_entries(
+        tid, TransactionType.INCOME, TransactionNature.SALARY, amount, _NOW,
+        to_account_id=to_id, to_account_type=to_type,
+    )
+
+
+def _transfer(tid, nature, amount, from_id, from_type, to_id, to_type):
+    """create_entries() for a TRANSFER between two accounts, dated _NOW."""
+    return _ENGINE.create_entries(
+        tid, TransactionType.TRANSFER, nature, amount, _NOW,
+        from_account_id=from_id, from_account_type=from_type,
+        to_account_id=to_id, to_account_type=to_type,
+    )
+
+
+def _assert_balanced(entries):
+    """Assert debits == credits in whole paise (exact, no epsilon); return the paise total."""
+    debit_paise = sum(round(d * 100) for d in map(_DEBIT, entries))
+    credit_paise = sum(round(c * 100) for c in map(_CREDIT, entries))
+    assert debit_paise == credit_paise
+    return debit_paise
+
+
+def _by_acct(entries):
+    """Index ledger entries by account_id."""
+    return {e.account_id: e for e in entries}
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -41,6 +94,13 @@ from accounting.classifier import TransactionClassifier
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+# The enums are immutable, so the type → nature buckets are flattened once
+_NATURE_COUNTS = Counter(n for natures in VALID_NATURE_FOR_TYPE.values() for n in natures)
+_ALL_NATURES_UNION = frozenset(_NATURE_COUNTS)
+# Natures listed more than once (across or within buckets)
+_DUPLICATE_NATURES = {n for n, count in _NATURE_COUNTS.items() if count > 1}
+
+
 class TestEnums:
     def test_transaction_types_complete(self):
         assert set(TransactionType) == {
@@ -51,14 +111,11 @@ class TestEnums:
 
     def test_every_nature_belongs_to_exactly_one_type(self):
         """Each nature must be in exactly one type bucket."""
-        all_natures = set()
-        for natures in VALID_NATURE_FOR_TYPE.values():
-            for n in natures:
-                assert n not in all_natures, f"{n} appears in multiple types"
-                all_natures.add(n)
+        assert not _DUPLICATE_NATURES, f"{_DUPLICATE_NATURES} appear in multiple types"
         # Every defined nature should be accounted for
-        for n in TransactionNature:
-            assert n in all_natures, f"{n} not assigned to any type"
+        assert set(TransactionNature) <= _ALL_NATURES_UNION, (
+            set(TransactionNature) - _ALL_NATURES_UNION
+        )
 
     def test_account_type_mapping(self):
         assert infer_accounting_type("savings") == AccountingType.ASSET
@@ -76,195 +133,139 @@ class TestEnums:
         assert not is_valid_nature_for_type(TransactionType.EXPENSE, TransactionNature.SALARY)
         assert not is_valid_nature_for_type(TransactionType.TRANSFER, TransactionNature.SALARY)
 
+    def test_schema_literals_match_enums(self):
+        """Request-schema Literals must accept exactly the enum values."""
+        pytest.importorskip("pydantic")
+        from backend.schemas import (
+            TransactionNatureEnum,
+            TransactionNatureLiteral,
+            TransactionTypeEnum,
+            TransactionTypeLiteral,
+        )
+
+        assert set(get_args(TransactionTypeLiteral)) == {e.value for e in TransactionTypeEnum}
+        assert set(get_args(TransactionNatureLiteral)) == {e.value for e in TransactionNatureEnum}
+        # ...and the schema enums mirror the accounting enums
+        assert {e.value for e in TransactionTypeEnum} == {e.value for e in TransactionType}
+        assert {e.value for e in TransactionNatureEnum} == {e.value for e in TransactionNature}
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  VALIDATION TESTS
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-class TestValidation:
-
-    def test_valid_income(self):
-        """Income with category and no from_account should pass."""
-        txn = TransactionInput(
-            transaction_type=TransactionType.INCOME,
-            transaction_nature=TransactionNature.SALARY,
-            amount=50000,
-            to_account_id=1,
-            category="Salary",
-        )
-        errors = validate_transaction_soft(txn)
-        assert errors == []
-
-    def test_expense_without_category_fails(self):
-        """EXPENSE requires a category."""
-        txn = TransactionInput(
-            transaction_type=TransactionType.EXPENSE,
-            transaction_nature=TransactionNature.PURCHASE,
-            amount=500,
-            from_account_id=1,
-            # No category
-        )
-        errors = validate_transaction_soft(txn)
-        assert any("category" in e.lower() for e in errors)
-
-    def test_expense_with_category_passes(self):
-        txn = TransactionInput(
-            transaction_type=TransactionType.EXPENSE,
-            transaction_nature=TransactionNature.PURCHASE,
-            amount=500,
-            from_account_id=1,
-            category="Groceries",
-        )
-        errors = validate_transaction_soft(txn)
-        assert errors == []
-
-    def test_income_with_from_account_fails(self):
-        """INCOME must not have a from_account."""
-        txn = TransactionInput(
-            transaction_type=TransactionType.INCOME,
-            transaction_nature=TransactionNature.SALARY,
-            amount=50000,
-            from_account_id=1,
-            to_account_id=2,
-            category="Salary",
-        )
-        errors = validate_transaction_soft(txn)
-        assert any("from_account" in e.lower() for e in errors)
-
-    def test_transfer_without_both_accounts_fails(self):
-        """TRANSFER requires both from and to accounts."""
-        txn = TransactionInput(
-            transaction_type=TransactionType.TRANSFER,
-            transaction_nature=TransactionNature.INTERNAL_TRANSFER,
-            amount=10000,
-            from_account_id=1,
-            # Missing to_account_id
-        )
-        errors = validate_transaction_soft(txn)
-        assert any("both" in e.lower() or "to_account" in e.lower() for e in errors)
-
-    def test_transfer_with_both_accounts_passes(self):
-        txn = TransactionInput(
-            transaction_type=TransactionType.TRANSFER,
-            transaction_nature=TransactionNature.INTERNAL_TRANSFER,
-            amount=10000,
-            from_account_id=1,
-            to_account_id=2,
-            from_account_type="savings",
-            to_account_type="current",
-        )
-        errors = validate_transaction_soft(txn)
-        assert errors == []
+_I, _E, _T = TransactionType.INCOME, TransactionType.EXPENSE, TransactionType.TRANSFER
+_N = TransactionNature
+
+# (TransactionInput kwargs, substring expected in some error, should_pass)
+_VALIDATION_CASES = [
+    # Income with category and no from_account should pass
+    pytest.param(
+        dict(transaction_type=_I, transaction_nature=_N.SALARY, amount=50000,
+             to_account_id=1, category="Salary"),
+        None, True, id="valid_income",
+    ),
+    # EXPENSE requires a category
+    pytest.param(
+        dict(transaction_type=_E, transaction_nature=_N.PURCHASE, amount=500,
+             from_account_id=1),
+        "category", False, id="expense_no_category",
+    ),
+    pytest.param(
+        dict(transaction_type=_E, transaction_nature=_N.PURCHASE, amount=500,
+             from_account_id=1, category="Groceries"),
+        None, True, id="expense_with_category",
+    ),
+    # INCOME must not have a from_account
+    pytest.param(
+        dict(transaction_type=_I, transaction_nature=_N.SALARY, amount=50000,
+             from_account_id=1, to_account_id=2, category="Salary"),
+        "from_account", False, id="income_with_from_account",
+    ),
+    # TRANSFER requires both from and to accounts
+    pytest.param(
+        dict(transaction_type=_T, transaction_nature=_N.INTERNAL_TRANSFER, amount=10000,
+             from_account_id=1),
+        "both", False, id="transfer_missing_to_account",
+    ),
+    pytest.param(
+        dict(transaction_type=_T, transaction_nature=_N.INTERNAL_TRANSFER, amount=10000,
+             from_account_id=1, to_account_id=2,
+             from_account_type="savings", to_account_type="current"),
+        None, True, id="transfer_with_both_accounts",
+    ),
+    pytest.param(
+        dict(transaction_type=_E, transaction_nature=_N.PURCHASE, amount=-100,
+             category="Food"),
+        "positive", False, id="negative_amount",
+    ),
+    # Salary is INCOME nature, not EXPENSE
+    pytest.param(
+        dict(transaction_type=_E, transaction_nature=_N.SALARY, amount=500,
+             category="Food"),
+        "nature", False, id="wrong_nature_for_type",
+    ),
+    pytest.param(
+        dict(transaction_type=_T, transaction_nature=_N.LOAN_GIVEN, amount=5000,
+             from_account_id=1, to_account_id=2,
+             from_account_type="savings", to_account_type="receivable"),
+        "counterparty", False, id="loan_no_counterparty",
+    ),
+    pytest.param(
+        dict(transaction_type=_T, transaction_nature=_N.LOAN_GIVEN, amount=5000,
+             from_account_id=1, to_account_id=2,
+             from_account_type="savings", to_account_type="receivable",
+             counterparty="John"),
+        None, True, id="loan_with_counterparty",
+    ),
+    # credit_card is a LIABILITY, not an ASSET
+    pytest.param(
+        dict(transaction_type=_T, transaction_nature=_N.INTERNAL_TRANSFER, amount=10000,
+             from_account_id=1, to_account_id=2,
+             from_account_type="savings", to_account_type="credit_card"),
+        "asset", False, id="internal_transfer_not_asset_to_asset",
+    ),
+    pytest.param(
+        dict(transaction_type=_T, transaction_nature=_N.CC_BILL_PAYMENT, amount=15000,
+             from_account_id=1, to_account_id=2,
+             from_account_type="savings", to_account_type="credit_card"),
+        None, True, id="cc_bill_asset_to_liability",
+    ),
+    # Loan given should land in a receivable
+    pytest.param(
+        dict(transaction_type=_T, transaction_nature=_N.LOAN_GIVEN, amount=5000,
+             from_account_id=1, to_account_id=2,
+             from_account_type="savings", to_account_type="savings",
+             counterparty="John"),
+        "receivable", False, id="loan_given_not_to_receivable",
+    ),
+    pytest.param(
+        dict(transaction_type=_E, transaction_nature=_N.PURCHASE, amount=500,
+             category="Food", to_account_type="receivable"),
+        "receivable", False, id="expense_to_receivable",
+    ),
+]
 
-    def test_negative_amount_fails(self):
-        txn = TransactionInput(
-            transaction_type=TransactionType.EXPENSE,
-            transaction_nature=TransactionNature.PURCHASE,
-            amount=-100,
-            category="Food",
-        )
-        errors = validate_transaction_soft(txn)
-        assert any("positive" in e.lower() for e in errors)
 
-    def test_wrong_nature_for_type_fails(self):
-        """Salary is INCOME nature, not EXPENSE."""
-        txn = TransactionInput(
-            transaction_type=TransactionType.EXPENSE,
-            transaction_nature=TransactionNature.SALARY,
-            amount=500,
-            category="Food",
-        )
-        errors = validate_transaction_soft(txn)
-        assert any("nature" in e.lower() for e in errors)
-
-    def test_loan_without_counterparty_fails(self):
-        txn = TransactionInput(
-            transaction_type=TransactionType.TRANSFER,
-            transaction_nature=TransactionNature.LOAN_GIVEN,
-            amount=5000,
-            from_account_id=1,
-            to_account_id=2,
-            from_account_type="savings",
-            to_account_type="receivable",
-            # No counterparty
-        )
-        errors = validate_transaction_soft(txn)
-        assert any("counterparty" in e.lower() for e in errors)
-
-    def test_loan_with_counterparty_passes(self):
-        txn = TransactionInput(
-            transaction_type=TransactionType.TRANSFER,
-            transaction_nature=TransactionNature.LOAN_GIVEN,
-            amount=5000,
-            from_account_id=1,
-            to_account_id=2,
-            from_account_type="savings",
-            to_account_type="receivable",
-            counterparty="John",
-        )
-        errors = validate_transaction_soft(txn)
-        assert errors == []
-
-    def test_internal_transfer_must_be_asset_to_asset(self):
-        txn = TransactionInput(
-            transaction_type=TransactionType.TRANSFER,
-            transaction_nature=TransactionNature.INTERNAL_TRANSFER,
-            amount=10000,
-            from_account_id=1,
-            to_account_id=2,
-            from_account_type="savings",
-            to_account_type="credit_card",  # LIABILITY, not ASSET
-        )
-        errors = validate_transaction_soft(txn)
-        assert any("asset" in e.lower() for e in errors)
-
-    def test_cc_bill_must_be_asset_to_liability(self):
-        txn = TransactionInput(
-            transaction_type=TransactionType.TRANSFER,
-            transaction_nature=TransactionNature.CC_BILL_PAYMENT,
-            amount=15000,
-            from_account_id=1,
-            to_account_id=2,
-            from_account_type="savings",
-            to_account_type="credit_card",
-        )
-        errors = validate_transaction_soft(txn)
-        assert errors == []
-
-    def test_loan_given_must_be_asset_to_receivable(self):
-        txn = TransactionInput(
-            transaction_type=TransactionType.TRANSFER,
-            transaction_nature=TransactionNature.LOAN_GIVEN,
-            amount=5000,
-            from_account_id=1,
-            to_account_id=2,
-            from_account_type="savings",
-            to_account_type="savings",  # Should be receivable
-            counterparty="John",
-        )
-        errors = validate_transaction_soft(txn)
-        assert any("receivable" in e.lower() for e in errors)
+class TestValidation:
 
-    def test_expense_to_receivable_blocked(self):
-        txn = TransactionInput(
-            transaction_type=TransactionType.EXPENSE,
-            transaction_nature=TransactionNature.PURCHASE,
-            amount=500,
-            category="Food",
-            to_account_type="receivable",
-        )
-        errors = validate_transaction_soft(txn)
-        assert any("receivable" in e.lower() for e in errors)
+    @pytest.mark.parametrize("txn_kwargs, expected_substr, should_pass", _VALIDATION_CASES)
+    def test_validation_case(self, txn_kwargs, expected_substr, should_pass):
+        errors = validate_transaction_soft(txn(**txn_kwargs))
+        if should_pass:
+            assert errors == []
+        else:
+            assert _has(errors, expected_substr), errors
 
     def test_validate_raises_on_error(self):
-        txn = TransactionInput(
+        invalid = txn(
             transaction_type=TransactionType.EXPENSE,
             transaction_nature=TransactionNature.PURCHASE,
             amount=-1,
         )
         with pytest.raises(ValidationError) as exc_info:
-            validate_transaction(txn)
+            validate_transaction(invalid)
         assert len(exc_info.value.errors) > 0
 
 
@@ -273,205 +274,92 @@ class TestValidation:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-class TestLedger:
-    engine = LedgerEngine()
-    now = datetime.utcnow()
+# Income and expense post their other leg to this virtual account
+_VIRTUAL_ACCT = 0
+
+# (txn_type, txn_nature, amount, from_id, from_type, to_id, to_type,
+#  expected_from_credit, expected_from_debit, expected_to_credit, expected_to_debit)
+_LEDGER_CASES = [
+    pytest.param(
+        (_I, _N.SALARY, 50000, None, None, 1, "savings", 50000, 0, 0, 50000),
+        id="income",
+    ),
+    pytest.param(
+        (_E, _N.PURCHASE, 500, 1, "savings", None, None, 500, 0, 0, 500),
+        id="expense",
+    ),
+    # Savings → Current: source asset decreases (credit), destination increases (debit)
+    pytest.param(
+        (_T, _N.INTERNAL_TRANSFER, 5000, 1, "savings", 2, "current", 5000, 0, 0, 5000),
+        id="internal_transfer",
+    ),
+    # Lending: Savings (ASSET) decreases → credit, Friend (RECEIVABLE) increases → debit
+    pytest.param(
+        (_T, _N.LOAN_GIVEN, 3000, 1, "savings", 10, "receivable", 3000, 0, 0, 3000),
+        id="loan_given",
+    ),
+    # Friend repays: RECEIVABLE decreases → credit, ASSET increases → debit
+    pytest.param(
+        (_T, _N.LOAN_REPAID, 3000, 10, "receivable", 1, "savings", 3000, 0, 0, 3000),
+        id="loan_repaid",
+    ),
+    # Pay CC: ASSET decreases → credit, LIABILITY decreases (paid off) → debit
+    pytest.param(
+        (_T, _N.CC_BILL_PAYMENT, 15000, 1, "savings", 3, "credit_card", 15000, 0, 0, 15000),
+        id="cc_bill_payment",
+    ),
+    # I borrow: PAYABLE increases (new debt) → credit, ASSET increases (got cash) → debit
+    pytest.param(
+        (_T, _N.LOAN_RECEIVED, 10000, 20, "payable", 1, "savings", 10000, 0, 0, 10000),
+        id="loan_received",
+    ),
+    # I repay: ASSET decreases → credit, PAYABLE decreases (debt reduced) → debit
+    pytest.param(
+        (_T, _N.LOAN_REPAID, 10000, 1, "savings", 20, "payable", 10000, 0, 0, 10000),
+        id="i_repay_loan",
+    ),
+]
+
+# Seeded, so failures reproduce; spans paise-free amounts up to 10 lakh
+_STRESS_AMOUNTS = np.random.default_rng(42).integers(1, 10**6, size=64).tolist()
+
 
-    def test_income_entries_balanced(self):
-        entries = self.engine.create_entries(
+class TestLedger:
+    @pytest.mark.parametrize("case", _LEDGER_CASES)
+    def test_double_entry(self, case):
+        (txn_type, txn_nature, amount, from_id, from_type, to_id, to_type,
+         from_credit, from_debit, to_credit, to_debit) = case
+        entries = _ENGINE.create_entries(
             transaction_id=1,
-            txn_type=TransactionType.INCOME,
-            txn_nature=TransactionNature.SALARY,
-            amount=50000,
-            date=self.now,
-            to_account_id=1,
-            to_account_type="savings",
-        )
-        assert len(entries) == 2
-        total_debit = sum(e.debit for e in entries)
-        total_credit = sum(e.credit for e in entries)
-        assert abs(total_debit - total_credit) < 0.001
-
-    def test_expense_entries_balanced(self):
-        entries = self.engine.create_entries(
-            transaction_id=2,
-            txn_type=TransactionType.EXPENSE,
-            txn_nature=TransactionNature.PURCHASE,
-            amount=500,
-            date=self.now,
-            from_account_id=1,
-            from_account_type="savings",
+            txn_type=txn_type,
+            txn_nature=txn_nature,
+            amount=amount,
+            date=_NOW,
+            from_account_id=from_id,
+            from_account_type=from_type,
+            to_account_id=to_id,
+            to_account_type=to_type,
         )
         assert len(entries) == 2
-        total_debit = sum(e.debit for e in entries)
-        total_credit = sum(e.credit for e in entries)
-        assert abs(total_debit - total_credit) < 0.001
-
-    def test_internal_transfer_balanced(self):
-        entries = self.engine.create_entries(
-            transaction_id=3,
-            txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.INTERNAL_TRANSFER,
-            amount=10000,
-            date=self.now,
-            from_account_id=1,
-            from_account_type="savings",
-            to_account_id=2,
-            to_account_type="current",
-        )
-        assert len(entries) == 2
-        total_debit = sum(e.debit for e in entries)
-        total_credit = sum(e.credit for e in entries)
-        assert abs(total_debit - total_credit) < 0.001
-
-    def test_internal_transfer_debits_credits_correct(self):
-        """
-        Savings → Current:
-          - Savings (ASSET) decreases → Credit
-          - Current (ASSET) increases → Debit
-        """
-        entries = self.engine.create_entries(
-            transaction_id=4,
-            txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.INTERNAL_TRANSFER,
-            amount=5000,
-            date=self.now,
-            from_account_id=1,
-            from_account_type="savings",
-            to_account_id=2,
-            to_account_type="current",
-        )
-        from_entry = [e for e in entries if e.account_id == 1][0]
-        to_entry = [e for e in entries if e.account_id == 2][0]
-        # Source asset decreases → credit
-        assert from_entry.credit == 5000
-        assert from_entry.debit == 0
-        # Destination asset increases → debit
-        assert to_entry.debit == 5000
-        assert to_entry.credit == 0
-
-    def test_loan_given_entries(self):
-        """
-        Lending money: Savings (ASSET) → Friend (RECEIVABLE)
-        Asset decreases → Credit
-        Receivable increases → Debit
-        """
-        entries = self.engine.create_entries(
-            transaction_id=5,
-            txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.LOAN_GIVEN,
-            amount=3000,
-            date=self.now,
-            from_account_id=1,
-            from_account_type="savings",
-            to_account_id=10,
-            to_account_type="receivable",
-        )
-        assert len(entries) == 2
-        from_entry = [e for e in entries if e.account_id == 1][0]
-        to_entry = [e for e in entries if e.account_id == 10][0]
-        assert from_entry.credit == 3000  # Asset decreases
-        assert to_entry.debit == 3000     # Receivable increases
-
-    def test_loan_repaid_entries(self):
-        """
-        Friend repays: Friend (RECEIVABLE) → Savings (ASSET)
-        Receivable decreases → Credit
-        Asset increases → Debit
-        """
-        entries = self.engine.create_entries(
-            transaction_id=6,
-            txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.LOAN_REPAID,
-            amount=3000,
-            date=self.now,
-            from_account_id=10,
-            from_account_type="receivable",
-            to_account_id=1,
-            to_account_type="savings",
-        )
-        from_entry = [e for e in entries if e.account_id == 10][0]
-        to_entry = [e for e in entries if e.account_id == 1][0]
-        assert from_entry.credit == 3000  # Receivable decreases
-        assert to_entry.debit == 3000     # Asset increases
-
-    def test_cc_bill_payment_entries(self):
-        """
-        Pay CC: Savings (ASSET) → Credit Card (LIABILITY)
-        Asset decreases → Credit
-        Liability decreases → Debit  (paying off debt)
-        """
-        entries = self.engine.create_entries(
-            transaction_id=7,
-            txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.CC_BILL_PAYMENT,
-            amount=15000,
-            date=self.now,
-            from_account_id=1,
-            from_account_type="savings",
-            to_account_id=3,
-            to_account_type="credit_card",
-        )
-        from_entry = [e for e in entries if e.account_id == 1][0]
-        to_entry = [e for e in entries if e.account_id == 3][0]
-        assert from_entry.credit == 15000  # Asset decreases
-        assert to_entry.debit == 15000     # Liability decreases (paid off)
-
-    def test_loan_received_entries(self):
-        """
-        I borrow money: Payable → Savings (ASSET)
-        Payable increases → Credit  (new debt)
-        Asset increases → Debit     (got cash)
-        """
-        entries = self.engine.create_entries(
-            transaction_id=8,
-            txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.LOAN_RECEIVED,
-            amount=10000,
-            date=self.now,
-            from_account_id=20,
-            from_account_type="payable",
-            to_account_id=1,
-            to_account_type="savings",
-        )
-        from_entry = [e for e in entries if e.account_id == 20][0]
-        to_entry = [e for e in entries if e.account_id == 1][0]
-        assert from_entry.credit == 10000  # Payable increases (new debt)
-        assert to_entry.debit == 10000     # Asset increases (got cash)
-
-    def test_i_repay_loan_entries(self):
-        """
-        I repay: Savings (ASSET) → Payable
-        Asset decreases → Credit
-        Payable decreases → Debit
-        """
-        entries = self.engine.create_entries(
-            transaction_id=9,
-            txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.LOAN_REPAID,
-            amount=10000,
-            date=self.now,
-            from_account_id=1,
-            from_account_type="savings",
-            to_account_id=20,
-            to_account_type="payable",
-        )
-        from_entry = [e for e in entries if e.account_id == 1][0]
-        to_entry = [e for e in entries if e.account_id == 20][0]
-        assert from_entry.credit == 10000  # Asset decreases
-        assert to_entry.debit == 10000     # Payable decreases (debt reduced)
+        _assert_balanced(entries)
+
+        by = _by_acct(entries)
+        from_entry = by[_VIRTUAL_ACCT if from_id is None else from_id]
+        to_entry = by[_VIRTUAL_ACCT if to_id is None else to_id]
+        assert from_entry.credit == from_credit
+        assert from_entry.debit == from_debit
+        assert to_entry.credit == to_credit
+        assert to_entry.debit == to_debit
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("amount", _STRESS_AMOUNTS)
+    def test_balance_invariant(self, amount):
+        entries = _transfer(1, _N.INTERNAL_TRANSFER, amount, 1, "savings", 2, "current")
+        assert _assert_balanced(entries) == amount * 100
 
     def test_account_balance_computation(self):
         """Test balance calculation from ledger entries."""
-        entries = self.engine.create_entries(
-            transaction_id=10,
-            txn_type=TransactionType.INCOME,
-            txn_nature=TransactionNature.SALARY,
-            amount=50000,
-            date=self.now,
-            to_account_id=1,
-            to_account_type="savings",
-        )
+        entries = _income(10, 50000, 1, "savings")
         balance = LedgerEngine.account_balance_from_entries(
             entries, account_id=1, acct_type=AccountingType.ASSET
         )
@@ -483,64 +371,54 @@ class TestLedger:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-class TestClassifier:
-    classifier = TransactionClassifier()
-
-    def test_salary_detection(self):
-        result = self.classifier.classify("Monthly Salary Credit")
-        assert result.transaction_type == TransactionType.INCOME
-        assert result.transaction_nature == TransactionNature.SALARY
-        assert result.confidence >= 0.8
-
-    def test_own_account_transfer_detection(self):
-        result = self.classifier.classify("OWN ACCOUNT TRANSFER FROM SAVINGS")
-        assert result.transaction_type == TransactionType.TRANSFER
-        assert result.transaction_nature == TransactionNature.INTERNAL_TRANSFER
-
-    def test_cc_bill_detection(self):
-        result = self.classifier.classify("CARD BILL PAYMENT,300126K03133,CA RD NO 3633")
-        assert result.transaction_type == TransactionType.TRANSFER
-        assert result.transaction_nature == TransactionNature.CC_BILL_PAYMENT
-
-    def test_loan_given_detection(self):
-        result = self.classifier.classify("Loan to Rahul for trip expenses")
-        assert result.transaction_type == TransactionType.TRANSFER
-        assert result.transaction_nature == TransactionNature.LOAN_GIVEN
-
-    def test_subscription_detection(self):
-        result = self.classifier.classify("Netflix Monthly Subscription")
-        assert result.transaction_type == TransactionType.EXPENSE
-        assert result.transaction_nature == TransactionNature.SUBSCRIPTION
-
-    def test_account_based_classification(self):
-        """When both accounts are ASSET → internal transfer."""
-        result = self.classifier.classify(
-            "Transfer between accounts",
-            from_account_type="savings",
-            to_account_type="current",
-        )
-        assert result.transaction_type == TransactionType.TRANSFER
-        assert result.transaction_nature == TransactionNature.INTERNAL_TRANSFER
-
-    def test_asset_to_receivable_classification(self):
-        """Asset → Receivable = loan given."""
-        result = self.classifier.classify(
-            "Sent money to friend",
-            from_account_type="savings",
-            to_account_type="receivable",
-        )
-        assert result.transaction_type == TransactionType.TRANSFER
-        assert result.transaction_nature == TransactionNature.LOAN_GIVEN
+@pytest.fixture(scope="session")
+def classifier():
+    return TransactionClassifier()
+
+
+# (description, extra classify() kwargs, expected_type, expected_nature,
+#  min_conf, max_conf) — None means "don't check"
+_CLASSIFIER_CASES = [
+    pytest.param("Monthly Salary Credit", {}, _I, _N.SALARY, 0.8, None, id="salary"),
+    pytest.param("OWN ACCOUNT TRANSFER FROM SAVINGS", {}, _T, _N.INTERNAL_TRANSFER, None, None,
+                 id="own_account_transfer"),
+    pytest.param("CARD BILL PAYMENT,300126K03133,CA RD NO 3633", {}, _T, _N.CC_BILL_PAYMENT,
+                 None, None, id="cc_bill"),
+    pytest.param("Loan to Rahul for trip expenses", {}, _T, _N.LOAN_GIVEN, None, None,
+                 id="loan_given"),
+    pytest.param("Netflix Monthly Subscription", {}, _E, _N.SUBSCRIPTION, None, None,
+                 id="subscription"),
+    # When both accounts are ASSET → internal transfer
+    pytest.param("Transfer between accounts",
+                 {"from_account_type": "savings", "to_account_type": "current"},
+                 _T, _N.INTERNAL_TRANSFER, None, None, id="asset_to_asset"),
+    # Asset → Receivable = loan given
+    pytest.param("Sent money to friend",
+                 {"from_account_type": "savings", "to_account_type": "receivable"},
+                 _T, _N.LOAN_GIVEN, None, None, id="asset_to_receivable"),
+    # No keyword match: fall back on the amount's sign, with low confidence
+    pytest.param("Unknown Credit", {"amount": 1500}, _I, None, None, 0.5,
+                 id="fallback_positive_amount"),
+    pytest.param("Unknown Debit", {"amount": -500}, _E, None, None, 0.5,
+                 id="fallback_negative_amount"),
+]
 
-    def test_fallback_positive_amount(self):
-        result = self.classifier.classify("Unknown Credit", amount=1500)
-        assert result.transaction_type == TransactionType.INCOME
-        assert result.confidence < 0.5  # Low confidence fallback
 
-    def test_fallback_negative_amount(self):
-        result = self.classifier.classify("Unknown Debit", amount=-500)
-        assert result.transaction_type == TransactionType.EXPENSE
-        assert result.confidence < 0.5
+class TestClassifier:
+    @pytest.mark.parametrize(
+        "text, kwargs, expected_type, expected_nature, min_conf, max_conf", _CLASSIFIER_CASES
+    )
+    def test_classify(
+        self, classifier, text, kwargs, expected_type, expected_nature, min_conf, max_conf
+    ):
+        result = classifier.classify(text, **kwargs)
+        assert result.transaction_type == expected_type
+        if expected_nature is not None:
+            assert result.transaction_nature == expected_nature
+        if min_conf is not None:
+            assert result.confidence >= min_conf
+        if max_conf is not None:
+            assert result.confidence < max_conf  # Low confidence fallback
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -548,27 +426,34 @@ class TestClassifier:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-class TestUXHints:
-    def test_transfer_hides_category(self):
-        hints = get_ux_hints(TransactionType.TRANSFER, TransactionNature.INTERNAL_TRANSFER)
-        assert hints["show_category"] is False
-        assert hints["require_both_accounts"] is True
-        assert hints["affects_net_worth"] is False
-
-    def test_expense_shows_category(self):
-        hints = get_ux_hints(TransactionType.EXPENSE, TransactionNature.PURCHASE)
-        assert hints["show_category"] is True
-        assert hints["affects_net_worth"] is True
+# (txn_type, txn_nature, expected subset of the hints dict)
+_HINT_CASES = [
+    pytest.param(
+        _T, _N.INTERNAL_TRANSFER,
+        {"show_category": False, "require_both_accounts": True, "affects_net_worth": False},
+        id="transfer_hides_category",
+    ),
+    pytest.param(
+        _E, _N.PURCHASE, {"show_category": True, "affects_net_worth": True},
+        id="expense_shows_category",
+    ),
+    pytest.param(
+        _T, _N.LOAN_GIVEN, {"require_counterparty": True, "affects_net_worth": False},
+        id="loan_requires_counterparty",
+    ),
+    # Income shows category (only TRANSFER hides it)
+    pytest.param(
+        _I, _N.SALARY, {"affects_net_worth": True, "show_category": True},
+        id="income_affects_net_worth",
+    ),
+]
 
-    def test_loan_requires_counterparty(self):
-        hints = get_ux_hints(TransactionType.TRANSFER, TransactionNature.LOAN_GIVEN)
-        assert hints["require_counterparty"] is True
-        assert hints["affects_net_worth"] is False
 
-    def test_income_affects_net_worth(self):
-        hints = get_ux_hints(TransactionType.INCOME, TransactionNature.SALARY)
-        assert hints["affects_net_worth"] is True
-        assert hints["show_category"] is True  # Income shows category (only TRANSFER hides it)
+class TestUXHints:
+    @pytest.mark.parametrize("tt, tn, expected", _HINT_CASES)
+    def test_hints(self, tt, tn, expected):
+        hints = get_ux_hints(tt, tn)
+        assert {k: hints[k] for k in expected} == expected
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -576,197 +461,102 @@ class TestUXHints:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+_A = AccountingType
+
+_BORROW_SPEC = dict(txn_type=_T, txn_nature=_N.LOAN_RECEIVED, amount=10000,
+                    from_account_id=20, from_account_type="payable",
+                    to_account_id=1, to_account_type="savings")
+
+# (start from salary_entries?, transaction specs in order,
+#  [(account_id, accounting_type, expected_balance)])
+_SCENARIOS = [
+    # Salary 50000, then 500 on groceries → net worth 49500
+    pytest.param(
+        True,
+        [dict(txn_type=_E, txn_nature=_N.PURCHASE, amount=500,
+              from_account_id=1, from_account_type="savings")],
+        [(1, _A.ASSET, 49500)],
+        id="salary_then_expense",
+    ),
+    # Transfer 20000 savings → current: combined net worth stays 50000
+    pytest.param(
+        True,
+        [dict(txn_type=_T, txn_nature=_N.INTERNAL_TRANSFER, amount=20000,
+              from_account_id=1, from_account_type="savings",
+              to_account_id=2, to_account_type="current")],
+        [(1, _A.ASSET, 30000), (2, _A.ASSET, 20000)],
+        id="transfer_does_not_change_net_worth",
+    ),
+    # Lend 5000 to a friend: 45000 (savings) + 5000 (receivable) = 50000
+    pytest.param(
+        True,
+        [dict(txn_type=_T, txn_nature=_N.LOAN_GIVEN, amount=5000,
+              from_account_id=1, from_account_type="savings",
+              to_account_id=10, to_account_type="receivable")],
+        [(1, _A.ASSET, 45000), (10, _A.RECEIVABLE, 5000)],
+        id="loan_does_not_change_net_worth",
+    ),
+    # Borrow 10000 (Payable → Asset): 10k assets, 10k liability, net worth 0
+    pytest.param(
+        False,
+        [_BORROW_SPEC],
+        [(1, _A.ASSET, 10000), (20, _A.PAYABLE, 10000)],
+        id="borrow",
+    ),
+    # ...then repay 10000 (Asset → Payable): nothing left on either side
+    pytest.param(
+        False,
+        [_BORROW_SPEC,
+         dict(txn_type=_T, txn_nature=_N.LOAN_REPAID, amount=10000,
+              from_account_id=1, from_account_type="savings",
+              to_account_id=20, to_account_type="payable")],
+        [(1, _A.ASSET, 0), (20, _A.PAYABLE, 0)],
+        id="borrow_and_repay",
+    ),
+    # Salary, then pay a 15000 CC bill (Asset → Liability).
+    # Only the payment is booked, so the CC liability just shows it decreased.
+    pytest.param(
+        True,
+        [dict(txn_type=_T, txn_nature=_N.CC_BILL_PAYMENT, amount=15000,
+              from_account_id=1, from_account_type="savings",
+              to_account_id=3, to_account_type="credit_card")],
+        [(1, _A.ASSET, 35000)],
+        id="cc_spend_and_payment",
+    ),
+]
+
+
+def run_batch(engine, specs):
+    """Book each create_entries() kwargs dict in order; return all entries."""
+    out = []
+    create, extend = engine.create_entries, out.extend
+    for spec in specs:
+        extend(create(**spec))
+    return out
+
+
+@pytest.fixture(scope="module")
+def salary_entries():
+    """Salary of 50000 into savings (account 1), the opening step of most scenarios."""
+    return list(_income(0, 50000, 1, "savings"))
+
+
+@pytest.mark.slow
 class TestScenarios:
-    engine = LedgerEngine()
-    now = datetime.utcnow()
-
-    def test_scenario_salary_then_expense(self):
-        """
-        1. Receive salary of 50000 into savings
-        2. Spend 500 on groceries
-        Net worth should be 49500
-        """
-        all_entries = []
-
-        # Salary
-        entries1 = self.engine.create_entries(
-            transaction_id=100, txn_type=TransactionType.INCOME,
-            txn_nature=TransactionNature.SALARY, amount=50000,
-            date=self.now, to_account_id=1, to_account_type="savings",
-        )
-        all_entries.extend(entries1)
-
-        # Expense
-        entries2 = self.engine.create_entries(
-            transaction_id=101, txn_type=TransactionType.EXPENSE,
-            txn_nature=TransactionNature.PURCHASE, amount=500,
-            date=self.now, from_account_id=1, from_account_type="savings",
-        )
-        all_entries.extend(entries2)
-
-        balance = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=1, acct_type=AccountingType.ASSET
-        )
-        assert balance == 49500
-
-    def test_scenario_transfer_does_not_change_net_worth(self):
-        """
-        1. Start with 50000 in savings
-        2. Transfer 20000 to current
-        Combined net worth should still be 50000
-        """
-        all_entries = []
-
-        # Initial salary
-        entries1 = self.engine.create_entries(
-            transaction_id=200, txn_type=TransactionType.INCOME,
-            txn_nature=TransactionNature.SALARY, amount=50000,
-            date=self.now, to_account_id=1, to_account_type="savings",
-        )
-        all_entries.extend(entries1)
-
-        # Transfer savings → current
-        entries2 = self.engine.create_entries(
-            transaction_id=201, txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.INTERNAL_TRANSFER, amount=20000,
-            date=self.now,
-            from_account_id=1, from_account_type="savings",
-            to_account_id=2, to_account_type="current",
-        )
-        all_entries.extend(entries2)
-
-        savings_balance = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=1, acct_type=AccountingType.ASSET
-        )
-        current_balance = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=2, acct_type=AccountingType.ASSET
-        )
-
-        assert savings_balance == 30000
-        assert current_balance == 20000
-        assert savings_balance + current_balance == 50000  # Net worth unchanged
-
-    def test_scenario_loan_does_not_change_net_worth(self):
-        """
-        1. Have 50000 in savings
-        2. Lend 5000 to friend (Asset → Receivable)
-        3. Net worth: 45000 (savings) + 5000 (receivable) = 50000
-        """
-        all_entries = []
-
-        entries1 = self.engine.create_entries(
-            transaction_id=300, txn_type=TransactionType.INCOME,
-            txn_nature=TransactionNature.SALARY, amount=50000,
-            date=self.now, to_account_id=1, to_account_type="savings",
-        )
-        all_entries.extend(entries1)
-
-        entries2 = self.engine.create_entries(
-            transaction_id=301, txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.LOAN_GIVEN, amount=5000,
-            date=self.now,
-            from_account_id=1, from_account_type="savings",
-            to_account_id=10, to_account_type="receivable",
-        )
-        all_entries.extend(entries2)
-
-        savings = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=1, acct_type=AccountingType.ASSET
-        )
-        receivable = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=10, acct_type=AccountingType.RECEIVABLE
-        )
-
-        assert savings == 45000
-        assert receivable == 5000
-        assert savings + receivable == 50000
-
-    def test_scenario_borrow_and_repay(self):
-        """
-        1. Borrow 10000 (Payable → Asset) — net worth = 0 (10k assets, 10k liability)
-        2. Repay 10000 (Asset → Payable) — net worth = 0 (0 assets, 0 liability)
-        """
-        all_entries = []
-
-        # Borrow
-        entries1 = self.engine.create_entries(
-            transaction_id=400, txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.LOAN_RECEIVED, amount=10000,
-            date=self.now,
-            from_account_id=20, from_account_type="payable",
-            to_account_id=1, to_account_type="savings",
-        )
-        all_entries.extend(entries1)
-
-        savings = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=1, acct_type=AccountingType.ASSET
-        )
-        payable = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=20, acct_type=AccountingType.PAYABLE
-        )
-        assert savings == 10000
-        assert payable == 10000
-        net_worth_after_borrow = savings - payable
-        assert net_worth_after_borrow == 0
-
-        # Repay
-        entries2 = self.engine.create_entries(
-            transaction_id=401, txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.LOAN_REPAID, amount=10000,
-            date=self.now,
-            from_account_id=1, from_account_type="savings",
-            to_account_id=20, to_account_type="payable",
-        )
-        all_entries.extend(entries2)
-
-        savings = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=1, acct_type=AccountingType.ASSET
-        )
-        payable = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=20, acct_type=AccountingType.PAYABLE
-        )
-        assert savings == 0
-        assert payable == 0
-        assert savings - payable == 0
-
-    def test_scenario_cc_spend_and_payment(self):
-        """
-        1. Receive salary 50000
-        2. Spend 5000 on CC (expense debits CC liability)
-           → For simplicity, expense from savings for now
-        3. Pay CC bill: Savings → Credit Card (Asset → Liability)
-        """
-        all_entries = []
-
-        # Salary
-        entries1 = self.engine.create_entries(
-            transaction_id=500, txn_type=TransactionType.INCOME,
-            txn_nature=TransactionNature.SALARY, amount=50000,
-            date=self.now, to_account_id=1, to_account_type="savings",
-        )
-        all_entries.extend(entries1)
-
-        # CC bill payment (15000)
-        entries2 = self.engine.create_entries(
-            transaction_id=501, txn_type=TransactionType.TRANSFER,
-            txn_nature=TransactionNature.CC_BILL_PAYMENT, amount=15000,
-            date=self.now,
-            from_account_id=1, from_account_type="savings",
-            to_account_id=3, to_account_type="credit_card",
-        )
-        all_entries.extend(entries2)
-
-        savings = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=1, acct_type=AccountingType.ASSET
-        )
-        cc = LedgerEngine.account_balance_from_entries(
-            all_entries, account_id=3, acct_type=AccountingType.LIABILITY
-        )
-
-        assert savings == 35000  # 50000 - 15000
-        # CC liability decreased (payment made)
-        # Since we only have the bill payment entry, CC shows -15000
-        # (it was decreased, which for a liability means less owed)
+    @pytest.mark.parametrize("from_salary, txns, balances", _SCENARIOS)
+    def test_scenario(self, salary_entries, from_salary, txns, balances):
+        # Copy the shared opening entries so scenarios stay isolated
+        all_entries = list(salary_entries) if from_salary else []
+        all_entries.extend(run_batch(
+            _ENGINE,
+            [dict(spec, transaction_id=txn_id, date=_NOW) for txn_id, spec in enumerate(txns, 1)],
+        ))
+
+        for account_id, acct_type, expected in balances:
+            balance = LedgerEngine.account_balance_from_entries(
+                all_entries, account_id=account_id, acct_type=acct_type
+            )
+            assert balance == expected, f"account {account_id}"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+"""
+Unit tests for CurrencyService rate lookup and caching.
+
+Tests cover:
+  1. LRU cache hits and the epoch-based TTL rollover
+  2. Static-pair short-circuit (no converter, no cache)
+  3. Unknown-currency fallback (misses are never cached)
+  4. Shared supported-currency metadata is read-only
+  5. Vectorised convert_batch agrees with per-row convert
+
+Run:  python -m pytest tests/test_currency.py -v
+"""
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from backend.services import currency as currency_mod
+from backend.services.currency import CURRENCY_INDEX, CurrencyService, _STATIC_PAIR_RATES
+
+
+class FakeConverter:
+    """Stands in for CurrencyConverter: fixed rates, counts every call."""
+
+    def __init__(self, rates):
+        self.rates = dict(rates)
+        self.calls = 0
+
+    def convert(self, amount, frm, to, date=None):
+        self.calls += 1
+        try:
+            return amount * self.rates[(frm, to)]
+        except KeyError:
+            raise ValueError(f"{frm} is not a supported currency") from None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(currency_mod.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def converter():
+    return FakeConverter({("EUR", "USD"): 1.1, ("USD", "EUR"): 1 / 1.1})
+
+
+@pytest.fixture
+def service(clock, converter):
+    svc = CurrencyService()
+    svc._converter = converter
+    return svc
+
+
+class TestRateCache:
+    def test_repeat_lookup_hits_cache(self, service, converter):
+        assert service.get_rate("EUR", "USD") == pytest.approx(1.1)
+        assert service.get_rate("eur", "usd") == pytest.approx(1.1)
+        assert converter.calls == 1
+        info = service._get_rate_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_epoch_rollover_refetches(self, service, converter, clock):
+        service.get_rate("EUR", "USD")
+        clock.now += service._cache_ttl - 1
+        service.get_rate("EUR", "USD")
+        assert converter.calls == 1  # still inside the TTL
+
+        clock.now += 1
+        converter.rates[("EUR", "USD")] = 1.2
+        assert service.get_rate("EUR", "USD") == pytest.approx(1.2)
+        assert converter.calls == 2
+        assert service._epoch == 1
+
+    def test_same_currency_is_one(self, service, converter):
+        assert service.get_rate("INR", "inr") == 1.0
+        assert converter.calls == 0
+
+
+class TestStaticPairs:
+    def test_static_pair_short_circuits(self, service, converter):
+        assert service.get_rate("QAR", "AED") == _STATIC_PAIR_RATES[("QAR", "AED")]
+        assert service.get_rate("USD", "SAR") == 3.75
+        assert converter.calls == 0
+        assert service._get_rate_cached.cache_info().currsize == 0
+
+    def test_static_pivot_through_converter(self, service, converter):
+        # EUR is not static: the USD pivot asks the converter for USD → EUR
+        rate = service.get_rate("QAR", "EUR")
+        assert rate == pytest.approx((1 / 1.1) / 3.64)
+
+
+class TestUnknownCurrency:
+    def test_unknown_falls_back_to_one(self, service, capsys):
+        assert service.get_rate("XXX", "INR") == 1.0
+        assert "No rate for XXX → INR" in capsys.readouterr().out
+        assert service.convert(250, "XXX", "INR") == 250
+
+    def test_miss_is_not_cached(self, service, converter):
+        service.get_rate("XXX", "USD")
+        calls = converter.calls
+        assert service._get_rate_cached.cache_info().currsize == 0
+
+        # A later lookup retries, and picks up the rate once a source has it
+        converter.rates[("XXX", "USD")] = 2.0
+        assert service.get_rate("XXX", "USD") == 2.0
+        assert converter.calls > calls
+
+    def test_converter_init_failure_uses_static_only(self, clock, monkeypatch):
+        def boom():
+            raise OSError("no ECB file")
+
+        monkeypatch.setattr(currency_mod, "CurrencyConverter", boom)
+        svc = CurrencyService()
+        assert svc.get_rate("QAR", "SAR") == _STATIC_PAIR_RATES[("QAR", "SAR")]
+        assert svc.get_rate("KWD", "BHD") == pytest.approx(0.376 / 0.307)
+        assert svc.get_rate("EUR", "USD") == 1.0
+
+
+class TestSupportedCurrencies:
+    def test_shared_result_is_read_only(self, service):
+        currencies = service.get_supported_currencies()
+        with pytest.raises(AttributeError):
+            currencies.append({"code": "XXX"})
+        with pytest.raises(TypeError):
+            currencies[0]["symbol"] = "?"
+        assert service.get_supported_currencies() is currencies
+        assert len(currencies) == len(currency_mod.CURRENCY_INFO)
+
+    def test_sorted_by_code(self, service):
+        codes = [c["code"] for c in service.get_supported_currencies()]
+        assert codes == sorted(codes)
+        assert {"code": "INR", "symbol": "₹", "name": "Indian Rupee", "locale": "en-IN"} in [
+            dict(c) for c in service.get_supported_currencies()
+        ]
+
+
+class TestBatchConversion:
+    def test_convert_batch_matches_convert(self, service):
+        # INR has no rate from the fake converter: both paths fall back to 1.0
+        rows = [(100.0, "EUR"), (2500.5, "QAR"), (-42.0, "USD"), (7.25, "AED"),
+                (1000.0, "INR"), (0.01, "SAR")]
+        amounts = np.array([amount for amount, _ in rows])
+        codes = np.array([CURRENCY_INDEX[code] for _, code in rows])
+
+        batch = service.convert_batch(amounts, codes, "usd")
+
+        assert batch.tolist() == [service.convert(a, code, "USD") for a, code in rows]
+
+    def test_rate_vector_falls_back_to_one(self, service):
+        vec = service.build_rate_vector("EUR")
+        assert vec.shape == (len(CURRENCY_INDEX),)
+        assert vec[CURRENCY_INDEX["EUR"]] == 1.0
+        assert vec[CURRENCY_INDEX["INR"]] == 1.0  # the fake converter has no INR rate
+
+    def test_module_import_does_not_load_numpy(self):
+        code = "import sys; import backend.services.currency; print('numpy' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(currency_mod.__file__))),
+        )
+        assert out.stdout.strip() == "False"
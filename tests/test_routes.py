@@ -0,0 +1,70 @@
+"""
+Route-level tests: response_model serialization of real SQLAlchemy rows.
+
+Run:  python -m pytest tests/test_routes.py -v
+"""
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# The repo root is put on sys.path by tests/conftest.py
+from backend.models import Base, LedgerEntry, Transaction, User
+from backend.accounting import routes as accounting_routes
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db_session):
+    app = FastAPI()
+    app.include_router(accounting_routes.router)
+    app.dependency_overrides[accounting_routes.get_db] = lambda: db_session
+    return TestClient(app)
+
+
+class TestLedgerRoute:
+    def test_ledger_entries_from_orm_rows(self, client, db_session):
+        """response_model=list[LedgerEntryOut] must accept ORM LedgerEntry rows."""
+        now = datetime(2024, 1, 15, 10, 30)
+        db_session.add(User(id=1, username="u", email="u@example.com", password_hash="x"))
+        db_session.add(Transaction(
+            id=1, user_id=1, description="Salary", amount=50000,
+            transaction_type="income", date=now,
+        ))
+        db_session.add_all([
+            LedgerEntry(id=1, transaction_id=1, account_id=None, debit=0.0,
+                        credit=50000.0, entry_date=now, description="Income: Salary"),
+            LedgerEntry(id=2, transaction_id=1, account_id=None, debit=50000.0,
+                        credit=0.0, entry_date=now, description="Income: Salary"),
+        ])
+        db_session.commit()
+
+        resp = client.get("/api/v1/accounting/transactions/1/ledger", params={"user_id": 1})
+
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert [e["id"] for e in body] == [1, 2]
+        assert sum(e["debit"] for e in body) == sum(e["credit"] for e in body) == 50000
+        assert body[0]["description"] == "Income: Salary"
+
+    def test_unknown_transaction_404(self, client):
+        resp = client.get("/api/v1/accounting/transactions/99/ledger", params={"user_id": 1})
+        assert resp.status_code == 404